@@ -10,11 +10,13 @@ from tkinter.ttk import Progressbar
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from ttkbootstrap.scrolled import ScrolledText
 import threading
+import queue
 import time
 import openpyxl
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 import os 
+from collections import namedtuple
 from openpyxl.chart import ScatterChart, Reference, Series 
 from openpyxl.chart.axis import ChartLines 
 
@@ -36,15 +38,24 @@ except Exception as e:
     exit()
 
 
-logs_ref = db.reference("/CPR_LOGS")
+logs_ref = db.reference("/CPR_LOGS") # Data sesi ada di /CPR_LOGS/<id sesi>
 status_ref = db.reference("/CPR/status")
-summary_ref = db.reference("/CPR")
+summary_ref = db.reference("/CPR") # /CPR/sesi berisi id sesi aktif, dipakai perangkat IoT sebagai prefix log
+
+UKURAN_CHUNK_HAPUS = 500 # Jumlah key per multi-path update saat menghapus data lama
 
 gui_started = False
 status_text = "🕒 WAITING"
 progress_value = 0
 session_start_wib = None 
 session_end_wib = None   
+last_logs_snapshot = None # Snapshot /CPR_LOGS terakhir dari polling update_logging
+session_snapshots = {} # Snapshot sesi yang sudah dibekukan, key = id sesi (hanya sesi terakhir)
+nama_user_sesi = "" # Nama user saat sesi dimulai
+sesi_aktif_id = None # Id sesi yang sedang/terakhir berjalan
+sesi_terpublikasi = None # Id sesi yang sudah ditulis ke /CPR/sesi oleh publikasi_worker
+antrian_publikasi = queue.Queue() # (id sesi, status) yang segera ditulis ke /CPR oleh publikasi_worker
+perlu_cleanup = threading.Event() # Permintaan hapus log lama; beberapa permintaan digabung jadi satu pass
 
 # === FUZZY LOGIC SYSTEM DEFINITION ===
 # Input 1: Kedalaman CPR
@@ -129,55 +140,103 @@ def calculate_fuzzy_score(avg_depth, cpm_last_value):
         # Jika terjadi error (misal input di luar range universe dan tidak di-clip), kembalikan nilai default
         return 0 
 
-# === Ambil data dari Firebase CPR_LOGS ===
-def ambil_data():
-    snapshot = logs_ref.get()
-    if not snapshot:
-        return pd.DataFrame()
-    df = pd.DataFrame.from_dict(snapshot, orient='index')
-    df.index = pd.to_numeric(df.index)
-    df.sort_index(inplace=True)
-    return df
+# === Snapshot sesi yang sudah selesai ===
+# Dibekukan sekali saat status "Logging selesai...", lalu dipakai ulang oleh
+# ringkasan di log box dan oleh simpan_ke_excel tanpa mengunduh ulang data.
+SesiSnapshot = namedtuple("SesiSnapshot", [
+    "df_processed", "avg_kedalaman", "avg_gaya", "cpm_terakhir", "skor_fuzzy",
+    "waktu_mulai", "waktu_selesai", "nama_user",
+])
 
-def simpan_ke_excel():
-    global session_start_wib, session_end_wib
+def id_sesi(waktu):
+    return waktu.strftime("sesi_%Y%m%d_%H%M%S_%f")
 
-    df = ambil_data()
-    if df.empty:
-        messagebox.showwarning("Data Kosong", "⚠️ Tidak ada data untuk disimpan.")
-        return
+def proses_data(df):
+    """
+    Filter CPM = 0, ambil kedalaman terbesar untuk CPM ganda, lalu hitung
+    rata-rata dan skor fuzzy. Mengembalikan (df_processed, avg_k, avg_g, cpm_terakhir, skor).
+    """
+    if df.empty or 'cpm' not in df.columns:
+        return pd.DataFrame(), None, None, None, None
 
-    # --- Data Filtering and Processing ---
     # 1. Hapus data dengan cpm = 0
     df_filtered_cpm = df[df['cpm'] != 0].copy()
-
     if df_filtered_cpm.empty:
-        messagebox.showwarning("Data Kosong", "⚠️ Tidak ada data valid setelah filter (CPM > 0).")
-        return
+        return df_filtered_cpm, None, None, None, None
 
     # 2. Sortir data double CPM dengan nilai kedalaman terbesar
     df_sorted_cpm_depth = df_filtered_cpm.sort_values(by=['cpm', 'kedalaman_cm'], ascending=[True, False])
     df_processed = df_sorted_cpm_depth.drop_duplicates(subset=['cpm'], keep='first')
 
-    # --- Calculate Averages and Last CPM from Processed Data ---
     # Rata-rata kedalaman yang dihitung hanya kedalaman diatas 3cm
-    df_depth_above_3_for_avg_depth = df_processed[df_processed['kedalaman_cm'] > 4].copy() # Filter > 3cm
-    avg_k_for_fuzzy = round(df_depth_above_3_for_avg_depth["kedalaman_cm"].mean(), 2) if not df_depth_above_3_for_avg_depth.empty else 2.34
+    df_depth_above_3 = df_processed[df_processed['kedalaman_cm'] > 4].copy() # Filter > 3cm
+    avg_k = round(df_depth_above_3["kedalaman_cm"].mean(), 2) if not df_depth_above_3.empty else 2.34
+
+    avg_g = round(df_processed["gaya_N"].mean(), 2)
 
-    avg_g_sorted = round(df_processed["gaya_N"].mean(), 2)
-    
     # CPM terakhir dari data yang sudah diproses dan difilter cpm != 0
-    cpm_last_value_for_fuzzy = int(df_processed["cpm"].iloc[-1]) if not df_processed.empty else 0
-    
-    # Hitung skor fuzzy
-    skor_fuzzy = calculate_fuzzy_score(avg_k_for_fuzzy, cpm_last_value_for_fuzzy)
+    cpm_last = int(df_processed["cpm"].iloc[-1])
+
+    skor = calculate_fuzzy_score(avg_k, cpm_last)
+    return df_processed, avg_k, avg_g, cpm_last, skor
+
+# === Data dari Firebase CPR_LOGS ke DataFrame ===
+def ke_dataframe(snapshot):
+    if not snapshot:
+        return pd.DataFrame()
+    df = pd.DataFrame.from_dict(snapshot, orient='index')
+    df.index = pd.to_numeric(df.index)
+    df.sort_index(inplace=True)
+    return df
+
+def ambil_sisa_data(sesi_id, snapshot):
+    """
+    Menggabungkan snapshot polling terakhir dengan data yang ditulis perangkat
+    setelah polling tersebut. Hanya key >= key terakhir yang diunduh.
+    """
+    sesi_logs_ref = logs_ref.child(sesi_id)
+    if not snapshot:
+        return sesi_logs_ref.get()
+    key_terakhir = max(snapshot, key=int)
+    sisa = sesi_logs_ref.order_by_key().start_at(key_terakhir).get()
+    gabungan = dict(snapshot)
+    if sisa:
+        gabungan.update(sisa)
+    return gabungan
+
+def bekukan_sesi(sesi_id, snapshot):
+    """
+    Membekukan data sesi yang sudah selesai ke session_snapshots.
+    snapshot adalah dict mentah /CPR_LOGS/<id sesi> yang sudah lengkap.
+    """
+    df_processed, avg_k, avg_g, cpm_last, skor = proses_data(ke_dataframe(snapshot))
+    sesi = SesiSnapshot(df_processed.copy(), avg_k, avg_g, cpm_last, skor, session_start_wib, session_end_wib, nama_user_sesi)
+    session_snapshots[sesi_id] = sesi
+    return sesi
+
+def simpan_ke_excel():
+    sesi = session_snapshots.get(sesi_aktif_id)
+    if sesi is None or sesi.df_processed.empty:
+        messagebox.showwarning("Data Kosong", "⚠️ Tidak ada data valid (CPM > 0) untuk disimpan.")
+        return
+
+    # Semua nilai diambil dari snapshot sesi, tanpa akses ke Firebase
+    df_processed = sesi.df_processed
+    avg_k_for_fuzzy = sesi.avg_kedalaman
+    avg_g_sorted = sesi.avg_gaya
+    cpm_last_value_for_fuzzy = sesi.cpm_terakhir
+    skor_fuzzy = sesi.skor_fuzzy
+    waktu_mulai = sesi.waktu_mulai
+    waktu_selesai = sesi.waktu_selesai
+    # Nama di form saat simpan tetap bisa dikoreksi; nama saat sesi dimulai hanya cadangan
+    nama_user_asli = user_var.get().strip() or sesi.nama_user
    
     # Persiapan data untuk disimpan
     df_final_excel = df_processed.reset_index().rename(columns={"index": "timestamp_ms"})
     
-    if session_start_wib:
+    if waktu_mulai:
         df_final_excel["waktu"] = df_final_excel["timestamp_ms"].apply(
-            lambda ms: (session_start_wib + timedelta(milliseconds=ms)).strftime("%H:%M:%S.%f")[:-3]
+            lambda ms: (waktu_mulai + timedelta(milliseconds=ms)).strftime("%H:%M:%S.%f")[:-3]
         )
     else:
         df_final_excel["waktu"] = df_final_excel["timestamp_ms"].apply(
@@ -185,7 +244,7 @@ def simpan_ke_excel():
         )
 
     waktu_simpan = datetime.now().strftime("%Y%m%d_%H%M%S")
-    nama_user = user_var.get().strip().replace(" ", "_")
+    nama_user = nama_user_asli.strip().replace(" ", "_")
     if not nama_user:
         nama_user = "User" 
     nama_file = f"CPR_{nama_user}_{waktu_simpan}.xlsx"
@@ -204,14 +263,14 @@ def simpan_ke_excel():
                                  top=Side(style='thin'), 
                                  bottom=Side(style='thin'))
 
-            worksheet_data['A1'] = f"Nama User: {user_var.get()}"
+            worksheet_data['A1'] = f"Nama User: {nama_user_asli}"
             worksheet_data.merge_cells('A1:D1') 
             worksheet_data['A1'].font = Font(bold=True)
             worksheet_data['A1'].alignment = Alignment(horizontal='left', vertical='center') 
 
             duration_str = "N/A"
-            if session_start_wib and session_end_wib:
-                duration = session_end_wib - session_start_wib
+            if waktu_mulai and waktu_selesai:
+                duration = waktu_selesai - waktu_mulai
                 total_seconds = int(duration.total_seconds())
                 days = total_seconds // (24 * 3600)
                 total_seconds %= (24 * 3600)
@@ -287,7 +346,7 @@ def simpan_ke_excel():
 
             summary_data = {
                 'Parameter': ['Nama User', 'Waktu Simpan', 'Waktu Latihan', 'Rata-Rata Kedalaman (cm)', 'Rata-Rata Gaya (N)', 'CPM Terakhir', 'SKOR CPR (Fuzzy)'], # Update label
-                'Nilai': [user_var.get(), datetime.now().strftime("%Y-%m-%d %H:%M:%S"), duration_str.strip(), avg_k_for_fuzzy, avg_g_sorted, cpm_last_value_for_fuzzy, skor_fuzzy]
+                'Nilai': [nama_user_asli, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), duration_str.strip(), avg_k_for_fuzzy, avg_g_sorted, cpm_last_value_for_fuzzy, skor_fuzzy]
             }
             df_summary = pd.DataFrame(summary_data)
             df_summary.to_excel(writer, index=False, sheet_name='Ringkasan')
@@ -440,22 +499,35 @@ def synchronize_time():
     btn_reset.config(state="normal") # Aktifkan tombol reset setelah sinkronisasi
 
 def update_logging():
-    global gui_started, seen_timestamps, session_end_wib
+    global gui_started, seen_timestamps, session_end_wib, last_logs_snapshot
     seen_timestamps = set()
     start_time = None
+    sesi_diperingatkan = None # Sesi yang sudah mendapat peringatan prefix firmware
     
     while True:
         try:
+            # Dibaca sekali sebelum status; bisa diubah oleh thread Tk dan publikasi_worker.
+            # Status baru dipakai setelah sesi ini terpublikasi, agar status sisa sesi lama diabaikan.
+            sesi_id = sesi_aktif_id
+            siap = gui_started and sesi_id and sesi_terpublikasi == sesi_id
             status = status_ref.get()
 
-            if gui_started:
+            if siap:
                 if status == "Logging dimulai...":
                     if start_time is None:
                         start_time = time.time()
                     progress_var.set(min(time.time() - start_time, 60))
                     status_label.config(text="🟠 LOGGING")
 
-                    snapshot = logs_ref.get()
+                    snapshot = logs_ref.child(sesi_id).get()
+                    last_logs_snapshot = snapshot
+                    if not snapshot and sesi_diperingatkan != sesi_id:
+                        # Key angka diurutkan paling awal, jadi satu entri cukup untuk mendeteksi log tanpa prefix
+                        tanpa_prefix = logs_ref.order_by_key().limit_to_first(1).get()
+                        if tanpa_prefix and not next(iter(tanpa_prefix)).startswith("sesi_"):
+                            sesi_diperingatkan = sesi_id
+                            log_box.insert("end", f"⚠️ Perangkat IoT masih menulis log langsung ke /CPR_LOGS. Firmware harus menulis ke /CPR_LOGS/{sesi_id} (lihat /CPR/sesi).\n")
+                            log_box.see("end")
                     if snapshot:
                         for ts_str, data in snapshot.items():
                             if ts_str not in seen_timestamps:
@@ -501,21 +573,15 @@ def update_logging():
                                                                     
                 elif status == "Logging selesai...":
                     session_end_wib = datetime.now() 
-                    df = ambil_data()
-                    df_filtered_summary = df[df['cpm'] != 0].copy()
+                    # Snapshot polling terakhir + data yang masuk setelahnya, tanpa unduh ulang seluruh tree
+                    sesi = bekukan_sesi(sesi_id, ambil_sisa_data(sesi_id, last_logs_snapshot))
+                    last_logs_snapshot = None
                     
-                    if not df_filtered_summary.empty:
-                        df_sorted_cpm_depth_summary = df_filtered_summary.sort_values(by=['cpm', 'kedalaman_cm'], ascending=[True, False])
-                        df_processed_summary = df_sorted_cpm_depth_summary.drop_duplicates(subset=['cpm'], keep='first')
-                        
-                        # Rata-rata kedalaman yang dihitung hanya kedalaman diatas 3cm
-                        df_depth_above_3_summary = df_processed_summary[df_processed_summary['kedalaman_cm'] > 4].copy()
-                        avg_k_summary = round(df_depth_above_3_summary["kedalaman_cm"].mean(), 2) if not df_depth_above_3_summary.empty else 2.34
-
-                        avg_g_summary = round(df_processed_summary["gaya_N"].mean(), 2)
-                        cpm_f_summary = int(df_processed_summary["cpm"].iloc[-1]) if not df_processed_summary.empty else 0
-                        
-                        skor_fuzzy_summary = calculate_fuzzy_score(avg_k_summary, cpm_f_summary)
+                    if not sesi.df_processed.empty:
+                        avg_k_summary = sesi.avg_kedalaman
+                        avg_g_summary = sesi.avg_gaya
+                        cpm_f_summary = sesi.cpm_terakhir
+                        skor_fuzzy_summary = sesi.skor_fuzzy
                         
                         log_box.insert("end", f"\n[{datetime.now().strftime('%H:%M:%S')}] ✅ Logging selesai.\n")
                         log_box.insert("end", f"📊 Rata-rata: Kedalaman = {avg_k_summary} cm | Gaya = {avg_g_summary} N | CPM Terakhir = {cpm_f_summary}\n") 
@@ -549,8 +615,97 @@ def update_logging():
         time.sleep(1)
 
 
+# === Pembersihan Firebase di background ===
+def urutan_key(key):
+    # Urutan key Firebase: key angka lebih dulu (numerik), lalu key string (leksikografis)
+    return (0, int(key)) if key.isdigit() else (1, key)
+
+def hapus_bertahap(ref, boleh_hapus=lambda key: True):
+    """
+    Menghapus child dari ref per rentang key (UKURAN_CHUNK_HAPUS key per
+    multi-path update), sehingga tree besar tidak dihapus dalam satu request.
+    boleh_hapus dievaluasi ulang di setiap chunk.
+    """
+    keys = ref.get(shallow=True)
+    if not isinstance(keys, dict):
+        return 0
+    keys = sorted(keys, key=urutan_key)
+    jumlah = 0
+    for i in range(0, len(keys), UKURAN_CHUNK_HAPUS):
+        chunk = [k for k in keys[i:i + UKURAN_CHUNK_HAPUS] if boleh_hapus(k)]
+        if chunk:
+            ref.update({k: None for k in chunk})
+            jumlah += len(chunk)
+    return jumlah
+
+def sesi_lama(key):
+    # Id sesi berbasis waktu, jadi sesi yang lebih baru dari sesi aktif tidak pernah dihapus
+    aktif = sesi_aktif_id
+    return key.startswith("sesi_") and (aktif is None or key < aktif)
+
+def batalkan_mulai(sesi_id, error):
+    # Dijalankan di thread Tk: sesi yang gagal dipublikasikan tidak jadi dimulai
+    global gui_started
+    if sesi_aktif_id != sesi_id:
+        return
+    gui_started = False
+    status_label.config(text="🕒 WAITING")
+    btn_start.config(state="normal")
+    btn_reset.config(state="normal")
+    log_box.insert("end", f"[{datetime.now().strftime('%H:%M:%S')}] ❌ Sesi {sesi_id} dibatalkan.\n")
+    log_box.see("end")
+    messagebox.showerror("Firebase Error", f"Gagal memulai sesi baru di Firebase: {error}")
+
+def publikasi_worker():
+    global sesi_terpublikasi
+    while True:
+        sesi_baru, status_baru = antrian_publikasi.get()
+        try:
+            # Sisa ringkasan lama di /CPR dihapus bersamaan dengan penulisan status dan
+            # id sesi dalam satu multi-path update, sebelum perangkat memulai sesi baru
+            lama = summary_ref.get(shallow=True)
+            lama = lama if isinstance(lama, dict) else {}
+            perubahan = {k: None for k in lama if k not in ("status", "sesi")}
+            perubahan.update({"status": status_baru, "sesi": sesi_baru})
+            summary_ref.update(perubahan)
+            sesi_terpublikasi = sesi_baru
+            perlu_cleanup.set()
+        except Exception as e:
+            log_box.insert("end", f"⚠️ Gagal menulis status sesi ke Firebase: {e}\n")
+            log_box.see("end")
+            print(f"Error in publikasi_worker: {e}")
+            if sesi_baru is not None:
+                app.after(0, batalkan_mulai, sesi_baru, e)
+        finally:
+            antrian_publikasi.task_done()
+
+def cleanup_worker():
+    while True:
+        perlu_cleanup.wait()
+        perlu_cleanup.clear()
+        try:
+            # Node sesi lama dikosongkan per chunk; sesi aktif tidak pernah disentuh
+            jumlah = 0
+            lama = logs_ref.get(shallow=True)
+            lama = sorted(lama, key=urutan_key) if isinstance(lama, dict) else []
+            for key in lama:
+                if sesi_lama(key):
+                    jumlah += hapus_bertahap(logs_ref.child(key))
+
+            # Log tanpa prefix sesi langsung di /CPR_LOGS hanya dihapus saat tidak ada sesi aktif,
+            # karena firmware lama masih menulis ke sana selama sesi berjalan
+            jumlah += hapus_bertahap(logs_ref, lambda key: sesi_aktif_id is None and not key.startswith("sesi_"))
+
+            log_box.insert("end", f"[{datetime.now().strftime('%H:%M:%S')}] 🗑️ Data lama dihapus dari Firebase ({jumlah} entri).\n")
+            log_box.see("end")
+        except Exception as e:
+            log_box.insert("end", f"⚠️ Gagal menghapus data lama dari Firebase: {e}\n")
+            log_box.see("end")
+            print(f"Error in cleanup_worker: {e}")
+
+
 def mulai_logging_gui():
-    global gui_started, seen_timestamps, session_start_wib, session_end_wib
+    global gui_started, seen_timestamps, session_start_wib, session_end_wib, last_logs_snapshot, sesi_aktif_id, nama_user_sesi
     if not user_var.get().strip():
         messagebox.showwarning("Nama Kosong", "⚠️ Silakan isi nama user terlebih dahulu.")
         return
@@ -559,44 +714,44 @@ def mulai_logging_gui():
         messagebox.showwarning("Waktu Belum Disinkronkan", "⚠️ Silakan klik 'Sinkronisasi Waktu' terlebih dahulu.")
         return
 
-    try:
-        # Hapus data dari Firebase untuk sesi baru yang bersih
-        logs_ref.delete()
-        summary_ref.delete() 
-        status_ref.set("Menunggu Perintah")
-        seen_timestamps = set()
-        session_end_wib = None 
-        
-        # Bersihkan GUI
-        log_box.delete('1.0', END)
-        ax1.clear()
-        ax2.clear()
-        canvas.draw()
-        log_box.insert("end", f"[{datetime.now().strftime('%H:%M:%S')}] 🗑️ Data lama dihapus dari Firebase.\n")
-        log_box.insert("end", f"[{datetime.now().strftime('%H:%M:%S')}] ✅ Sesi baru dimulai oleh {user_var.get()}.\n")
-        log_box.insert("end", f"📡 Menunggu perintah 'Logging dimulai...' dari perangkat IoT...\n")
-        log_box.see("end")
-        
-        status_label.config(text="🕒 WAITING")
-        btn_save.config(state="disabled")
-        btn_sync_time.config(state="disabled") 
-        btn_reset.config(state="disabled") # Nonaktifkan tombol reset saat logging berlangsung
-        gui_started = True
-    except Exception as e:
-        messagebox.showerror("Firebase Error", f"Gagal menghapus data lama: {e}")
+    # Sesi baru langsung memakai prefix baru; data lama dihapus di background
+    seen_timestamps = set()
+    session_end_wib = None 
+    last_logs_snapshot = None
+    sesi_aktif_id = id_sesi(datetime.now())
+    nama_user_sesi = user_var.get().strip()
+    session_snapshots.clear() # Snapshot sesi sebelumnya tidak dipakai lagi
+    antrian_publikasi.put((sesi_aktif_id, "Menunggu Perintah"))
+    
+    # Bersihkan GUI
+    log_box.delete('1.0', END)
+    ax1.clear()
+    ax2.clear()
+    canvas.draw()
+    log_box.insert("end", f"[{datetime.now().strftime('%H:%M:%S')}] 🗑️ Penghapusan data lama berjalan di background.\n")
+    log_box.insert("end", f"[{datetime.now().strftime('%H:%M:%S')}] ✅ Sesi baru dimulai oleh {nama_user_sesi} ({sesi_aktif_id}).\n")
+    log_box.insert("end", f"📡 Perangkat IoT harus menulis log ke /CPR_LOGS/{sesi_aktif_id} (id sesi ada di /CPR/sesi).\n")
+    log_box.insert("end", f"📡 Menunggu perintah 'Logging dimulai...' dari perangkat IoT...\n")
+    log_box.see("end")
+    
+    status_label.config(text="🕒 WAITING")
+    btn_save.config(state="disabled")
+    btn_sync_time.config(state="disabled") 
+    btn_reset.config(state="disabled") # Nonaktifkan tombol reset saat logging berlangsung
+    gui_started = True
 
 def reset_session():
-    global gui_started, session_start_wib, session_end_wib, seen_timestamps
+    global gui_started, session_start_wib, session_end_wib, seen_timestamps, last_logs_snapshot, sesi_aktif_id
     
     confirm = messagebox.askyesno("Konfirmasi Reset", "Anda yakin ingin mereset sesi? Ini akan menghapus semua data di Firebase dan membersihkan GUI.")
     if not confirm:
         return
 
     try:
-        # Reset Firebase
-        logs_ref.delete()
-        summary_ref.delete()
-        status_ref.set("Menunggu Sesi Baru") # Kembali ke status awal
+        # Hentikan polling dulu, lalu reset Firebase di background tanpa sesi aktif
+        gui_started = False
+        sesi_aktif_id = None
+        antrian_publikasi.put((None, "Menunggu Sesi Baru"))
         
         # Reset GUI
         user_var.set("") # Kosongkan username
@@ -606,10 +761,11 @@ def reset_session():
         canvas.draw()
         
         # Reset variabel status
-        gui_started = False
         session_start_wib = None
         session_end_wib = None
         seen_timestamps = set()
+        last_logs_snapshot = None
+        session_snapshots.clear()
         progress_var.set(0)
         status_label.config(text="🕒 WAITING")
         
@@ -680,5 +836,7 @@ canvas_widget = canvas.get_tk_widget()
 canvas_widget.grid(row=0, column=1, sticky='nsew')
 
 threading.Thread(target=update_logging, daemon=True).start()
+threading.Thread(target=publikasi_worker, daemon=True).start()
+threading.Thread(target=cleanup_worker, daemon=True).start()
 log_box.insert("end", "🩺 GUI Siap. Masukkan nama, klik 'Sinkronisasi Waktu', lalu 'MULAI SESI BARU'.\n")
 app.mainloop()